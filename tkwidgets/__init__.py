@@ -4,3 +4,4 @@
 from .radio_button import RadioButton, RadioVar
 from .check_button import CheckButton
 from .toggle_button import ToggleButton
+from .tree_column import CheckColumn, ToggleColumn, check_images, toggle_images
@@ -1,10 +1,44 @@
+import argparse
+import cProfile
+import os
+import time
 import tkinter as tk
+import traceback
 
 from .radio_button import RadioButton, RadioVar
 from .check_button import CheckButton
 from .toggle_button import ToggleButton
 
-import os
+parser = argparse.ArgumentParser(prog="python -m tkwidgets")
+parser.add_argument(
+    "--stress", type=int, default=0, metavar="N",
+    help="build N of each widget and click through them with a scripted driver")
+parser.add_argument(
+    "--profile", metavar="FILE",
+    help="run under cProfile and write the stats to FILE")
+parser.add_argument(
+    "--overlay", action="store_true",
+    help="show event-loop latency, animation FPS and canvas item counts")
+parser.add_argument(
+    "--depth", type=int, default=50, metavar="D",
+    help="length of the CheckButton parent chain built by --stress; "
+         "each level adds about 3 nested calls, so chains of roughly 300 "
+         "or more exceed Python's default recursion limit")
+parser.add_argument(
+    "--exit", action="store_true",
+    help="quit when the scripted driver has finished")
+args = parser.parse_args()
+
+if args.depth < 0:
+    parser.error("--depth must not be negative")
+
+if args.exit and args.stress <= 0:
+    parser.error("--exit requires --stress")
+
+if args.profile is not None:
+    profile = cProfile.Profile()
+    profile.enable()
+
 if os.name == "nt":
     import ctypes
     ctypes.OleDLL('shcore').SetProcessDpiAwareness(1)
@@ -77,4 +111,144 @@ label4.pack()
 toggle3.set_command(
     lambda: label4.config(text="ON" if toggle3.get() else "OFF"))
 
-root.mainloop()
+
+def count_frames(toggle: ToggleButton):
+    redraw_slider = toggle.redraw_slider
+    last = {"time": None}
+
+    def wrapper():
+        now = time.perf_counter()
+        # アニメーションの最初のフレームは前回との間隔に含めない
+        if getattr(toggle, "move", 0) > 1 and last["time"] is not None:
+            frames["count"] += 1
+            frames["time"] += now - last["time"]
+        last["time"] = now
+        redraw_slider()
+
+    toggle.redraw_slider = wrapper
+
+
+def build_stress(count):
+    window = tk.Toplevel(root)
+    window.title(f"TkWidgets - stress {count}")
+    columns = 25
+    actions = []
+
+    frame = tk.LabelFrame(window, text="CheckButton")
+    frame.pack(padx=10, pady=5, fill=tk.X)
+    checks = []
+    for i in range(count):
+        check = CheckButton(frame, width=16, margin=2)
+        check.grid(row=i//columns, column=i % columns)
+        if i > 0:
+            # 二分木状に親子関係を結ぶ
+            parent = checks[(i-1)//2]
+            parent.set_children(check)
+            check.set_parent(parent)
+        checks.append(check)
+    actions += [(check.check_press, None) for check in reversed(checks)]
+
+    frame = tk.LabelFrame(window, text="CheckButton chain")
+    frame.pack(padx=10, pady=5, fill=tk.X)
+    chain = []
+    for i in range(args.depth):
+        check = CheckButton(frame, width=16, margin=2)
+        check.grid(row=i//columns, column=i % columns)
+        if i > 0:
+            # 一列に親子関係を結び、再帰的な同期を深くする
+            chain[-1].set_children(check)
+            check.set_parent(chain[-1])
+        chain.append(check)
+    if chain:
+        actions += [(chain[-1].check_press, None), (chain[0].check_press, None)]
+
+    frame = tk.LabelFrame(window, text="RadioButton")
+    frame.pack(padx=10, pady=5, fill=tk.X)
+    radio_var = RadioVar()
+    for i in range(count):
+        radio = RadioButton(frame, variable=radio_var, width=14, margin=2)
+        radio.grid(row=i//columns, column=i % columns)
+        actions.append((radio.check_press, None))
+
+    frame = tk.LabelFrame(window, text="ToggleButton")
+    frame.pack(padx=10, pady=5, fill=tk.X)
+    for i in range(count):
+        toggle = ToggleButton(
+            frame, radius=8, width=16, height=22, margin=2)
+        toggle.grid(row=i//columns, column=i % columns)
+        count_frames(toggle)
+        actions.append((toggle.slider_press, None))
+
+    return actions
+
+
+def run_driver(actions, index=0):
+    if index >= len(actions):
+        if args.exit:
+            root.quit()
+        return
+    function, event = actions[index]
+    try:
+        function(event)
+    except Exception:
+        # 失敗した操作を記録して残りの操作を続ける
+        traceback.print_exc()
+    root.after(1, run_driver, actions, index+1)
+
+
+def build_overlay():
+    window = tk.Toplevel(root)
+    window.title("TkWidgets - overlay")
+    window.attributes("-topmost", True)
+    label = tk.Label(
+        window, justify=tk.LEFT, font=("Courier New", 12, "bold"))
+    label.pack(padx=10, pady=10)
+    stats = {"latency": 0.0}
+
+    def canvases(widget):
+        for child in widget.winfo_children():
+            if isinstance(child, tk.Canvas):
+                yield child
+            yield from canvases(child)
+
+    def measure(expected):
+        now = time.perf_counter()
+        stats["latency"] = max(stats["latency"], now - expected)
+        root.after(10, measure, time.perf_counter() + 0.01)
+
+    def update():
+        if frames["time"] > 0:
+            fps = f"{frames['count'] / frames['time']:7.1f}"
+        else:
+            fps = f"{'-':>7}"
+        items = sum(len(canvas.find_all()) for canvas in canvases(root))
+        label.config(text=(
+            f"latency: {stats['latency']*1000:7.1f} ms\n"
+            f"fps    : {fps}\n"
+            f"items  : {items:7d}"))
+        frames["count"] = 0
+        frames["time"] = 0.0
+        stats["latency"] = 0.0
+        root.after(1000, update)
+
+    measure(time.perf_counter())
+    update()
+
+
+frames = {"count": 0, "time": 0.0}
+count_frames(toggle1)
+count_frames(toggle3)
+
+if args.stress > 0:
+    actions = build_stress(args.stress)
+    root.after(500, run_driver, actions)
+
+if args.overlay:
+    build_overlay()
+
+try:
+    root.mainloop()
+finally:
+    if args.profile is not None:
+        profile.disable()
+        profile.dump_stats(args.profile)
@@ -7,6 +7,31 @@ UNCHECKED = 0
 CHECKED = 1
 INDETERMINATE = 2
 
+# Base64のDataURI
+CHECK_IMAGE = """
+    iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAA
+    Af5JREFUeF7tmlGywiAMRXVnLK1LY2c6dMSptUASbiBQ/HnOmxpyDoFi6vNx89fz
+    5vyPJWBVwM0NrCVw8wKYexP03r/CBDvnkpU+7RII8N77vcCdc0kJUwqI8Nu27QLC
+    35SE6QSc4eMel5IwlYAUfE7CNAJK8CkJUwigwl9JGF4AF/68KQ4toBY+yBhWAAJ+
+    WAEo+CEFIOGHE4CGH0qABvwwArTghxCgCW9egDa8aQEt4M0KaAVvUkBL+KIASk8N
+    2VRtDZ8VQO2poQT0gE8K4PTUEAJ6wV8K4PbUagX0hP8TUEom112ViCiNdxUTncO3
+    H0BNBpUAdbyjBNTYx5i7AG4ytYlwxyv19iXVFz8jElCTkCX4nz2gRWItxuBWw09P
+    UDNBzdhc6L894PgPjUQ1YtZAZwVINsXcnmAZnnQUjk9YKcbPdwfr8KQvQ+EZu0TC
+    p5JEn839oIEyEZxrig9GpLMYlwU1mdqzBXWc83VFAdI9gZNQL/jiEqi9O1Ak9IRn
+    CdCohN7wbAFICRbgRQIQEqzAiwXUSLAEXyVAIsEafLUAjgSL8BABVAnhRNnyhEe5
+    BcME5CRYnfkoiHQSpNps3U6n5pW7DirgWAnhfe5HyojkETHgAqKEjwCV+AhwlSWA
+    TKxVLPMzpC1iCdA2bD3+qgDrM6Sd36oAbcPW49++At5aYFBfS24sggAAAABJRU5E
+    rkJggg=="""
+
+MINUS_IMAGE = """
+    iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAA
+    AOZJREFUeF7tmEEOgzAMBM3P/DQ/LT+j4tBWFSRIveEZrlyym5k4yhbwb4PnDwuQ
+    AHgDKgAHwENQBVQA3oAKwAFwCqiACsAbUAE4AE4BFVABeAMqAAfAKbBUoKr2qno0
+    JMf6q2qac/qjQ/j3zq1KuCygU/i7Ek4FjDH2zHw09rPFjzEiM38ynwrouPsrCq4U
+    2Ftu/zfUmoCIYBeAVwB/CB6qdKRgdhfwIrQ68TuQ8PdVuPko/MTzPYCy07OcEiAB
+    8AZUAA6Aj6IqoALwBlQADoBTQAVUAN6ACsABcAqogArAG1ABOADxAn6KSEGt6UZn
+    AAAAAElFTkSuQmCC"""
+
 
 class CheckButton(tk.Canvas):
     """
@@ -54,33 +79,10 @@ class CheckButton(tk.Canvas):
                 height=width+self.margin*2, takefocus=self.binding,
                 bg=bg, highlightbackground=bg)
 
-        # Base64のDataURI
         self.image = tk.PhotoImage(
-            data="""
-            iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAA
-            Af5JREFUeF7tmlGywiAMRXVnLK1LY2c6dMSptUASbiBQ/HnOmxpyDoFi6vNx89fz
-            5vyPJWBVwM0NrCVw8wKYexP03r/CBDvnkpU+7RII8N77vcCdc0kJUwqI8Nu27QLC
-            35SE6QSc4eMel5IwlYAUfE7CNAJK8CkJUwigwl9JGF4AF/68KQ4toBY+yBhWAAJ+
-            WAEo+CEFIOGHE4CGH0qABvwwArTghxCgCW9egDa8aQEt4M0KaAVvUkBL+KIASk8N
-            2VRtDZ8VQO2poQT0gE8K4PTUEAJ6wV8K4PbUagX0hP8TUEom112ViCiNdxUTncO3
-            H0BNBpUAdbyjBNTYx5i7AG4ytYlwxyv19iXVFz8jElCTkCX4nz2gRWItxuBWw09P
-            UDNBzdhc6L894PgPjUQ1YtZAZwVINsXcnmAZnnQUjk9YKcbPdwfr8KQvQ+EZu0TC
-            p5JEn839oIEyEZxrig9GpLMYlwU1mdqzBXWc83VFAdI9gZNQL/jiEqi9O1Ak9IRn
-            CdCohN7wbAFICRbgRQIQEqzAiwXUSLAEXyVAIsEafLUAjgSL8BABVAnhRNnyhEe5
-            BcME5CRYnfkoiHQSpNps3U6n5pW7DirgWAnhfe5HyojkETHgAqKEjwCV+AhwlSWA
-            TKxVLPMzpC1iCdA2bD3+qgDrM6Sd36oAbcPW49++At5aYFBfS24sggAAAABJRU5E
-            rkJggg=="""
-        ).zoom(self.width).subsample(72)
+            data=CHECK_IMAGE).zoom(self.width).subsample(72)
         self.minus = tk.PhotoImage(
-            data="""
-            iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAA
-            AOZJREFUeF7tmEEOgzAMBM3P/DQ/LT+j4tBWFSRIveEZrlyym5k4yhbwb4PnDwuQ
-            AHgDKgAHwENQBVQA3oAKwAFwCqiACsAbUAE4AE4BFVABeAMqAAfAKbBUoKr2qno0
-            JMf6q2qac/qjQ/j3zq1KuCygU/i7Ek4FjDH2zHw09rPFjzEiM38ynwrouPsrCq4U
-            2Ftu/zfUmoCIYBeAVwB/CB6qdKRgdhfwIrQ68TuQ8PdVuPko/MTzPYCy07OcEiAB
-            8AZUAA6Aj6IqoALwBlQADoBTQAVUAN6ACsABcAqogArAG1ABOADxAn6KSEGt6UZn
-            AAAAAElFTkSuQmCC"""
-        ).zoom(self.width).subsample(72)
+            data=MINUS_IMAGE).zoom(self.width).subsample(72)
 
         self.redraw_check()
 
@@ -0,0 +1,371 @@
+
+# ©2021-2024 Ryo Fujinami.
+
+import math
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Tuple
+
+from .check_button import CHECK_IMAGE, MINUS_IMAGE, UNCHECKED, CHECKED, INDETERMINATE
+
+
+def _image_cache(master) -> Dict[tuple, Tuple[tk.PhotoImage, ...]]:
+    # Tkインスタンスと一緒に破棄されるようにルートに保持する
+    root = master._root()
+    if not hasattr(root, "_tkwidgets_images"):
+        root._tkwidgets_images = {}
+    return root._tkwidgets_images
+
+
+def _fill_rectangle(image, x1, y1, x2, y2, color):
+    # Canvasと同じく画像の外にはみ出す部分は切り取る
+    x1, y1 = max(x1, 0), max(y1, 0)
+    x2, y2 = min(x2, image.width()), min(y2, image.height())
+    if x2 > x1 and y2 > y1:
+        image.put(color, to=(x1, y1, x2, y2))
+
+
+def _fill_oval(image, x1, y1, x2, y2, color):
+    cx = (x1 + x2) / 2
+    cy = (y1 + y2) / 2
+    rx = (x2 - x1) / 2
+    ry = (y2 - y1) / 2
+    if rx <= 0 or ry <= 0:
+        return
+    for y in range(int(y1), int(math.ceil(y2))):
+        dy = (y + 0.5 - cy) / ry
+        if abs(dy) >= 1:
+            continue
+        half = rx * math.sqrt(1 - dy * dy)
+        _fill_rectangle(
+            image, int(round(cx - half)), y, int(round(cx + half)), y + 1, color)
+
+
+def _fill_pill(image, x1, y1, x2, y2, color):
+    height = y2 - y1
+    _fill_rectangle(image, x1 + height // 2, y1, x2 - height // 2, y2, color)
+    _fill_oval(image, x1, y1, x1 + height, y2, color)
+    _fill_oval(image, x2 - height, y1, x2, y2, color)
+
+
+def check_images(master, /, width=14, margin=2):
+    """
+    Render the CheckButton states into PhotoImages, once per style.
+
+    Args:
+        master (tk.Widget): Any widget of the target Tk instance.
+        width (int): Size of the check box in pixels.
+        margin (int): Transparent margin around the check box.
+
+    Returns:
+        tuple of tk.PhotoImage: Images indexed by UNCHECKED, CHECKED and INDETERMINATE.
+    """
+    cache = _image_cache(master)
+    key = ("check", width, margin)
+    if key in cache:
+        return cache[key]
+
+    size = width + margin * 2
+    line = int(round(width / 12))
+    outer1 = margin - line // 2
+    outer2 = margin + width + (line + 1) // 2
+    inner1 = margin + (line + 1) // 2
+    inner2 = margin + width - line // 2
+
+    images = []
+    for glyph in (None, CHECK_IMAGE, MINUS_IMAGE):
+        image = tk.PhotoImage(master=master, width=size, height=size)
+        _fill_rectangle(image, outer1, outer1, outer2, outer2, "black")
+        _fill_rectangle(image, inner1, inner1, inner2, inner2, "white")
+        if glyph is not None:
+            mark = tk.PhotoImage(
+                master=master, data=glyph).zoom(width).subsample(72)
+            image.tk.call(
+                image, "copy", mark, "-to",
+                width // 2 + margin - mark.width() // 2,
+                width // 2 + margin - mark.height() // 2)
+        images.append(image)
+
+    cache[key] = tuple(images)
+    return cache[key]
+
+
+def toggle_images(
+        master, /,
+        fg="white", bg1="lightgray", bg2="lightgreen",
+        radius=7, width=14, height=16, outline=False, margin=1, gray=False):
+    """
+    Render the ToggleButton states into PhotoImages, once per style.
+
+    Args:
+        master (tk.Widget): Any widget of the target Tk instance.
+        fg (str): Color of the slider.
+        bg1 (str): Track color in the 'off' state.
+        bg2 (str): Track color in the 'on' state.
+        radius (int): Radius of the slider in pixels.
+        width (int): Width of the slider's track in pixels.
+        height (int): Height of the track in pixels.
+        outline (bool): If True, draws an outline around the slider.
+        margin (int): Transparent margin around the track.
+        gray (bool): If True, adds a gray background track.
+
+    Returns:
+        tuple of tk.PhotoImage: Images for the 'off' and 'on' states.
+    """
+    cache = _image_cache(master)
+    key = ("toggle", fg, bg1, bg2,
+           radius, width, height, outline, margin, gray)
+    if key in cache:
+        return cache[key]
+
+    # グレーの縁取りの分だけ余白を広げる
+    border = 2 if gray else 0
+    cvh = (radius*2 if radius*2 > height else height)+(margin+border)*2
+    cvw = cvh + width
+    line = "silver" if outline else fg
+
+    if radius*2 > height:
+        top = radius+margin+border-height//2
+        left = radius+margin+border-height//2
+        slider_top = margin+border
+        slider_left = margin+border
+    else:
+        top = margin+border
+        left = margin+border
+        slider_top = height//2-radius+margin+border
+        slider_left = height//2-radius+margin+border
+
+    images = []
+    for current in (False, True):
+        image = tk.PhotoImage(master=master, width=cvw, height=cvh)
+        if gray:
+            color = "silver" if radius*2 >= height else "gray"
+            _fill_pill(
+                image, left-2, top-2, left+height+width+2, top+height+2, color)
+        _fill_pill(
+            image, left, top, left+height+width, top+height,
+            bg2 if current else bg1)
+        position = slider_left + (width if current else 0)
+        _fill_oval(
+            image, position-1, slider_top-1,
+            position+radius*2+1, slider_top+radius*2+1, line)
+        _fill_oval(
+            image, position+1, slider_top+1,
+            position+radius*2-1, slider_top+radius*2-1, fg)
+        images.append(image)
+
+    cache[key] = tuple(images)
+    return cache[key]
+
+
+class _ImageColumn:
+    """
+    Base class turning the image of a ttk.Treeview tree column into a clickable state.
+
+    Args:
+        tree (ttk.Treeview): The treeview whose "#0" column holds the images.
+        images (tuple of tk.PhotoImage): Images indexed by state.
+        binding (bool): If True, binds mouse and space key events to the treeview.
+        command (callable): Called with the item id when the user changes an item.
+    """
+    def __init__(self, tree: ttk.Treeview, images, binding=True, command=None):
+        self.tree = tree
+        self.images = images
+        self.binding = binding
+        self.command = command
+        self.states: Dict[str, int] = {}
+        self.change_command = None
+
+        if self.binding is True:
+            self.tree.bind("<ButtonPress-1>", self.check_press, add="+")
+            self.tree.bind("<KeyRelease-space>", self.key_press, add="+")
+
+    def insert(self, parent, index, iid=None, state=UNCHECKED, **kw):
+        item = self.tree.insert(
+            parent, index, iid, image=self.images[int(state)], **kw)
+        self.states[item] = int(state)
+        return item
+
+    def delete(self, *items):
+        """Delete items and the states of their whole subtrees."""
+        for item in items:
+            self.forget(item)
+        self.tree.delete(*items)
+
+    def move(self, item, parent, index):
+        self.tree.move(item, parent, index)
+
+    def identify(self, x, y):
+        """Return the item whose state image is under (x, y), or None."""
+        if self.tree.identify_region(x, y) != "tree":
+            return None
+        if "image" not in self.tree.identify_element(x, y):
+            return None
+        return self.tree.identify_row(y) or None
+
+    def check_press(self, event):
+        item = self.identify(event.x, event.y)
+        if item is None:
+            return
+        self.toggle(item)
+        return "break"
+
+    def key_press(self, event):
+        items = self.tree.selection()
+        if not items:
+            return
+        # 親子が同時に選択されていても結果が順序に依存しないようにする
+        value = int(not self.get(items[0]))
+        for item in items:
+            self.set(item, value)
+        if self.command is not None:
+            for item in items:
+                self.command(item)
+
+    def toggle(self, item):
+        self.set(item, int(not bool(self.get_state(item))))
+        if self.command is not None:
+            self.command(item)
+
+    def redraw_item(self, item):
+        self.tree.item(item, image=self.images[self.get_state(item)])
+
+    def set_command(self, command):
+        self.command = command
+
+    def set_change_command(self, command):
+        self.change_command = command
+
+    def set(self, item, value):
+        if int(value) == self.get_state(item):
+            return
+        self.states[item] = int(value)
+        self.redraw_item(item)
+        if self.change_command is not None:
+            self.change_command(item)
+
+    def get(self, item):
+        return bool(self.get_state(item))
+
+    def get_state(self, item):
+        return self.states.get(item, UNCHECKED)
+
+    def forget(self, item):
+        """Drop the states of item and its descendants without deleting them."""
+        stack = [item]
+        while stack:
+            child = stack.pop()
+            self.states.pop(child, None)
+            stack.extend(self.tree.get_children(child))
+
+
+class CheckColumn(_ImageColumn):
+    """
+    Tri-state check column for a ttk.Treeview, drawn with cached CheckButton images.
+    Like CheckButton parents and children, states are synchronized over the item hierarchy.
+    Items must be inserted, moved and deleted through the column to keep parents in sync.
+
+    Args:
+        tree (ttk.Treeview): The treeview whose "#0" column holds the check boxes.
+        width (int): Size of the check box in pixels.
+        margin (int): Transparent margin around the check box.
+        binding (bool): If True, binds mouse and space key events to the treeview.
+        command (callable): Called with the item id when the user changes an item.
+    """
+    def __init__(
+            self, tree: ttk.Treeview, /,
+            width=14, margin=2, binding=True, command=None):
+        _ImageColumn.__init__(
+            self, tree, check_images(tree, width=width, margin=margin),
+            binding=binding, command=command)
+
+    def insert(self, parent, index, iid=None, state=UNCHECKED, **kw):
+        item = _ImageColumn.insert(self, parent, index, iid, state, **kw)
+        if not parent:
+            return item
+        # 兄弟を走査せずに親の状態を更新する
+        current = self.get_state(parent)
+        state = UNCHECKED if int(state) == UNCHECKED else CHECKED
+        if self.tree.prev(item) == "" and self.tree.next(item) == "":
+            self.set(parent, state)
+        elif current != INDETERMINATE and current != state:
+            self.set(parent, INDETERMINATE)
+        return item
+
+    def delete(self, *items):
+        parents = {self.tree.parent(item) for item in items}
+        _ImageColumn.delete(self, *items)
+        for parent in parents:
+            if parent and self.tree.exists(parent):
+                self.sync_myself(parent)
+
+    def move(self, item, parent, index):
+        old_parent = self.tree.parent(item)
+        _ImageColumn.move(self, item, parent, index)
+        if old_parent == parent:
+            return
+        if old_parent:
+            self.sync_myself(old_parent)
+        if parent:
+            self.sync_myself(parent)
+
+    def set(self, item, value):
+        if int(value) == self.get_state(item):
+            return
+        _ImageColumn.set(self, item, value)
+        self.sync_children(item)
+        self.sync_parent(item)
+
+    def sync_children(self, item):
+        current = self.get_state(item)
+        if current == INDETERMINATE:
+            return
+        stack: List[str] = list(self.tree.get_children(item))
+        while stack:
+            child = stack.pop()
+            if self.get_state(child) == current:
+                continue
+            self.states[child] = current
+            self.redraw_item(child)
+            if self.change_command is not None:
+                self.change_command(child)
+            stack.extend(self.tree.get_children(child))
+
+    def sync_parent(self, item):
+        parent = self.tree.parent(item)
+        if parent:
+            self.sync_myself(parent)
+
+    def sync_myself(self, item):
+        unchecked = False
+        checked = False
+        for child in self.tree.get_children(item):
+            data = self.get_state(child)
+            if data == UNCHECKED:
+                unchecked = True
+            elif (data == CHECKED) or (data == INDETERMINATE):
+                checked = True
+        if checked and not unchecked:
+            self.set(item, CHECKED)
+        elif checked and unchecked:
+            self.set(item, INDETERMINATE)
+        else:
+            self.set(item, UNCHECKED)
+
+
+class ToggleColumn(_ImageColumn):
+    """
+    On/off column for a ttk.Treeview, drawn with cached ToggleButton images.
+
+    Args:
+        tree (ttk.Treeview): The treeview whose "#0" column holds the toggles.
+        binding (bool): If True, binds mouse and space key events to the treeview.
+        command (callable): Called with the item id when the user changes an item.
+        **style: Passed to toggle_images (fg, bg1, bg2, radius, width, height, ...).
+    """
+    def __init__(
+            self, tree: ttk.Treeview, /,
+            binding=True, command=None, **style):
+        _ImageColumn.__init__(
+            self, tree, toggle_images(tree, **style),
+            binding=binding, command=command)